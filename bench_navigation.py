@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Navigation benchmark for GitHub Repository Pruner
+Measures the frame time of each Keep click and theme toggle on a large session
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# One frame at 60 Hz
+FRAME_BUDGET_MS = 16.0
+
+def summarize(label, times):
+    times = sorted(times)
+    p95 = times[max(0, int(len(times) * 0.95) - 1)]
+    print(f"{label:<16} median {statistics.median(times):6.2f} ms  "
+          f"p95 {p95:6.2f} ms  max {times[-1]:6.2f} ms  ({len(times)} samples)")
+    return p95
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark repository navigation frame times')
+    parser.add_argument('--repos', type=int, default=100000, help='Repositories in the session')
+    parser.add_argument('--clicks', type=int, default=500, help='Keep clicks to time')
+    parser.add_argument('--toggles', type=int, default=10, help='Theme toggles to time')
+    parser.add_argument('--bulk', action='store_true', help='Show the bulk selection list while navigating')
+    args = parser.parse_args()
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    with tempfile.TemporaryDirectory() as home:
+        # Keep the benchmark's config and decision log away from the real ones
+        os.environ['HOME'] = home
+        from PyQt6.QtWidgets import QApplication
+        from main import MainWindow
+        from theme_manager import ThemeManager
+
+        app = QApplication(sys.argv[:1])
+        theme_manager = ThemeManager()
+        start = time.perf_counter()
+        theme_manager.apply(app, 'light_blue')
+        print(f"First theme apply: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        window = MainWindow(theme_manager)
+        window.show()
+        app.processEvents()
+
+        # A synthetic session: only review state, nothing on disk is touched
+        root = Path(home) / 'repos'
+        window.repo_manager.load_repos(
+            (root / f'repo-{i:06d}', root) for i in range(args.repos)
+        )
+        window.review_active = True
+        window.update_repo_count()
+        if args.bulk:
+            window.bulk_btn.setChecked(True)
+        window.load_current_repo()
+        app.processEvents()
+
+        click_times = []
+        for _ in range(args.clicks):
+            start = time.perf_counter()
+            window.keep_btn.click()
+            window.repaint()
+            app.processEvents()
+            click_times.append((time.perf_counter() - start) * 1000)
+
+        toggle_times = []
+        for _ in range(args.toggles):
+            start = time.perf_counter()
+            window.theme_btn.click()
+            window.repaint()
+            app.processEvents()
+            toggle_times.append((time.perf_counter() - start) * 1000)
+
+        print(f"{args.repos} repositories{' with bulk list' if args.bulk else ''}")
+        click_p95 = summarize('Keep click', click_times)
+        summarize('Theme toggle', toggle_times)
+
+        ok = click_p95 <= FRAME_BUDGET_MS
+        print(f"Navigation {'within' if ok else 'OVER'} the {FRAME_BUDGET_MS:.0f} ms frame budget")
+        return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Scan benchmark for GitHub Repository Pruner
+Measures network scan mode against a local tree with injected latency
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from repo_manager import scan_root_network
+
+class LatencyFS:
+    """Filesystem shim that adds a fixed delay to every request, like an NFS round trip"""
+    def __init__(self, latency, hang_every=0):
+        self.latency = latency
+        self.hang_every = hang_every
+        self._calls = 0
+    
+    def scandir(self, path):
+        time.sleep(self.latency)
+        return os.scandir(path)
+    
+    def exists(self, path):
+        self._calls += 1
+        if self.hang_every and self._calls % self.hang_every == 0:
+            # Simulate a server that never answers this request
+            time.sleep(3600)
+        time.sleep(self.latency)
+        return os.path.exists(path)
+
+def build_tree(root, count):
+    """Create count directories under root, every other one a git repository"""
+    for i in range(count):
+        repo = Path(root) / f'repo-{i:05d}'
+        repo.mkdir()
+        if i % 2 == 0:
+            (repo / '.git').mkdir()
+        else:
+            (repo / 'README.md').write_text('not a repository\n')
+    # Plain files are filtered by d_type and never probed
+    (Path(root) / 'notes.txt').write_text('')
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the network scan mode')
+    parser.add_argument('--repos', type=int, default=400, help='Directories to create')
+    parser.add_argument('--latency-ms', type=float, default=5.0, help='Delay per request')
+    parser.add_argument('--max-concurrency', type=int, default=64, help='Highest concurrency to try')
+    parser.add_argument('--timeout', type=float, default=1.0, help='Per-entry timeout in seconds')
+    parser.add_argument('--hang-every', type=int, default=0,
+                        help='Make every Nth probe hang to exercise the timeout (0 disables)')
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as root:
+        build_tree(root, args.repos)
+        print(f"{args.repos} directories, {args.latency_ms:.1f} ms latency per request")
+        print(f"{'in flight':>9}  {'seconds':>8}  {'speedup':>7}  {'repos':>6}  {'timed out':>9}")
+        
+        baseline = None
+        concurrency = 1
+        while concurrency <= args.max_concurrency:
+            fs = LatencyFS(args.latency_ms / 1000, args.hang_every)
+            start = time.perf_counter()
+            try:
+                repos, timed_out = scan_root_network(
+                    root, concurrency, args.timeout, scandir=fs.scandir, exists=fs.exists
+                )
+            except TimeoutError:
+                # Every probe slot hung, so the whole root was given up on
+                print(f"{concurrency:>9}  {'root timed out: all probes stuck':>38}")
+                concurrency *= 2
+                continue
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{concurrency:>9}  {elapsed:>8.3f}  {baseline / elapsed:>6.1f}x  "
+                  f"{len(repos):>6}  {len(timed_out):>9}")
+            concurrency *= 2
+
+if __name__ == "__main__":
+    main()
@@ -6,13 +6,14 @@ class ConfigManager:
     def __init__(self):
         self.config_dir = Path.home() / '.config' / 'gh-repo-pruner'
         self.config_file = self.config_dir / 'config.json'
+        self.decisions_file = self.config_dir / 'decisions.jsonl'
         self._ensure_config_exists()
         
     def _ensure_config_exists(self):
         """Ensure config directory and file exist"""
         self.config_dir.mkdir(parents=True, exist_ok=True)
         if not self.config_file.exists():
-            self._save_config({'base_path': None, 'github_token': None})
+            self._save_config({'base_paths': [], 'github_token': None})
     
     def _save_config(self, config_data):
         """Save configuration to file"""
@@ -24,19 +25,51 @@ class ConfigManager:
         with open(self.config_file, 'r') as f:
             return json.load(f)
     
-    def get_base_path(self):
-        """Get the configured base path"""
+    def get_base_paths(self):
+        """Get the configured base paths, migrating a legacy single base path"""
         config = self._load_config()
-        return config.get('base_path')
+        if 'base_paths' in config:
+            return list(config['base_paths'] or [])
+        legacy = config.get('base_path')
+        return [legacy] if legacy else []
     
-    def set_base_path(self, path):
-        """Set the base path"""
-        if path and not os.path.isdir(path):
-            raise ValueError("Path does not exist or is not a directory")
+    def set_base_paths(self, paths):
+        """Set the list of base paths"""
+        for path in paths:
+            self._check_base_path(path)
+        self._save_base_paths(paths)
+    
+    def add_base_path(self, path):
+        """Add a base path to the configured list.
+        
+        Only the new path is checked: a root that is already configured may
+        be temporarily missing, e.g. an unmounted external drive.
+        """
+        self._check_base_path(path)
+        self._save_base_paths(self.get_base_paths() + [path])
+    
+    @staticmethod
+    def _check_base_path(path):
+        if not os.path.isdir(path):
+            raise ValueError(f"Path does not exist or is not a directory: {path}")
+    
+    def _save_base_paths(self, paths):
         config = self._load_config()
-        config['base_path'] = path
+        config.pop('base_path', None)
+        # Normalise so '/x', '/x/' and symlinks to /x collapse into one entry,
+        # then drop duplicates while keeping the user's ordering
+        config['base_paths'] = list(dict.fromkeys(os.path.realpath(p) for p in paths))
         self._save_config(config)
     
+    def get_base_path(self):
+        """Get the first configured base path"""
+        paths = self.get_base_paths()
+        return paths[0] if paths else None
+    
+    def set_base_path(self, path):
+        """Set a single base path, replacing any others"""
+        self.set_base_paths([path] if path else [])
+    
     def get_github_token(self):
         """Get the configured GitHub Personal Access Token"""
         config = self._load_config()
@@ -46,4 +79,109 @@ class ConfigManager:
         """Set the GitHub Personal Access Token"""
         config = self._load_config()
         config['github_token'] = token
-        self._save_config(config)
\ No newline at end of file
+        self._save_config(config)
+    
+    def get_scan_settings(self):
+        """Get the scan mode, probe concurrency and per-entry timeout.
+        
+        Invalid values in a hand-edited config fall back to the defaults.
+        """
+        config = self._load_config()
+        mode = config.get('scan_mode')
+        concurrency = config.get('scan_concurrency')
+        timeout = config.get('scan_timeout')
+        return {
+            'mode': mode if mode in ('local', 'network') else 'local',
+            'concurrency': concurrency if self._valid_count(concurrency) else 16,
+            'timeout': timeout if self._valid_timeout(timeout) else 5.0,
+        }
+    
+    def set_scan_settings(self, mode, concurrency=None, timeout=None):
+        """Set the scan mode ('local' or 'network') and its tuning"""
+        if mode not in ('local', 'network'):
+            raise ValueError(f"Unknown scan mode: {mode}")
+        if concurrency is not None and not self._valid_count(concurrency):
+            raise ValueError("Scan concurrency must be a whole number of at least 1")
+        if timeout is not None and not self._valid_timeout(timeout):
+            raise ValueError("Scan timeout must be a positive number of seconds")
+        config = self._load_config()
+        config['scan_mode'] = mode
+        if concurrency is not None:
+            config['scan_concurrency'] = concurrency
+        if timeout is not None:
+            config['scan_timeout'] = timeout
+        self._save_config(config)
+    
+    @staticmethod
+    def _valid_count(value):
+        return isinstance(value, int) and not isinstance(value, bool) and value >= 1
+    
+    @staticmethod
+    def _valid_timeout(value):
+        return isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0
+    
+    def record_decisions(self, decisions):
+        """Append (repo, root, decision) review decisions to the decision log"""
+        # Append-only, so recording a click costs the same for any history size
+        with open(self.decisions_file, 'a') as f:
+            for repo, root, decision in decisions:
+                f.write(json.dumps({
+                    'path': str(repo),
+                    'root': str(root) if root else None,
+                    'decision': decision,
+                }) + '\n')
+    
+    def load_decisions(self):
+        """Load the latest decision per repo as {path: (root, decision)}"""
+        decisions = {}
+        lines = 0
+        try:
+            with open(self.decisions_file, 'r') as f:
+                for line in f:
+                    lines += 1
+                    try:
+                        entry = json.loads(line)
+                        decisions[entry['path']] = (entry['root'], entry['decision'])
+                    except (ValueError, KeyError, TypeError):
+                        # e.g. a line cut short by a crash mid-write
+                        continue
+        except FileNotFoundError:
+            return {}
+        
+        # Rewrite the log once superseded entries dominate it
+        if lines > 2 * len(decisions) + 1000:
+            tmp_file = self.decisions_file.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
+                for path, (root, decision) in decisions.items():
+                    f.write(json.dumps({'path': path, 'root': root, 'decision': decision}) + '\n')
+            os.replace(tmp_file, self.decisions_file)
+        return decisions
+    
+    def get_delete_settings(self):
+        """Get the storage type and the number of parallel delete workers.
+        
+        Invalid values in a hand-edited config fall back to the defaults.
+        """
+        config = self._load_config()
+        storage_type = config.get('storage_type')
+        if storage_type not in ('ssd', 'hdd'):
+            storage_type = 'ssd'
+        workers = config.get('delete_workers')
+        # SSDs handle many concurrent unlinks; HDDs thrash seeking between trees
+        default_workers = 8 if storage_type == 'ssd' else 2
+        return {
+            'storage_type': storage_type,
+            'workers': workers if self._valid_count(workers) else default_workers,
+        }
+    
+    def set_delete_settings(self, storage_type, workers=None):
+        """Set the storage type ('ssd' or 'hdd') and optionally a worker count"""
+        if storage_type not in ('ssd', 'hdd'):
+            raise ValueError(f"Unknown storage type: {storage_type}")
+        if workers is not None and not self._valid_count(workers):
+            raise ValueError("Delete workers must be a whole number of at least 1")
+        config = self._load_config()
+        config['storage_type'] = storage_type
+        if workers is not None:
+            config['delete_workers'] = workers
+        self._save_config(config)
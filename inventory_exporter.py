@@ -0,0 +1,434 @@
+import csv
+import json
+import os
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+FIELDS = [
+    'name', 'path', 'root', 'size_bytes',
+    'last_commit', 'last_commit_time', 'remote', 'decision'
+]
+FORMATS = ('csv', 'jsonl', 'parquet')
+
+# Rows buffered per Parquet row group; bounds memory for any tree size
+PARQUET_BATCH_SIZE = 10000
+
+def format_from_path(path, default='csv'):
+    """Guess the export format from a file extension, or return default"""
+    ext = os.path.splitext(str(path))[1].lower().lstrip('.')
+    if ext in ('json', 'ndjson'):
+        return 'jsonl'
+    return ext if ext in FORMATS else default
+
+def _read_text(path):
+    """Read a small git metadata file, tolerating any encoding"""
+    with open(path, 'rb') as f:
+        return f.read().decode('utf-8', errors='replace')
+
+def _git_dirs(repo_path):
+    """Resolve (git_dir, common_dir) for a repository.
+
+    Linked worktrees have a '.git' file pointing at their own git dir, which
+    holds HEAD; refs, objects and config live in the dir named by 'commondir'.
+    """
+    git_dir = os.path.join(repo_path, '.git')
+    if os.path.isfile(git_dir):
+        content = _read_text(git_dir).strip()
+        if content.startswith('gitdir:'):
+            git_dir = os.path.join(repo_path, content[len('gitdir:'):].strip())
+    try:
+        common_dir = _read_text(os.path.join(git_dir, 'commondir')).strip()
+    except OSError:
+        return git_dir, git_dir
+    return git_dir, os.path.normpath(os.path.join(git_dir, common_dir))
+
+def _resolve_ref(git_dir, common_dir, ref):
+    """Look a ref up as a loose file, then in packed-refs"""
+    for base in (git_dir, common_dir):
+        try:
+            return _read_text(os.path.join(base, ref)).strip() or None
+        except OSError:
+            pass
+    try:
+        packed = _read_text(os.path.join(common_dir, 'packed-refs'))
+    except OSError:
+        return None
+    for line in packed.splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[1] == ref:
+            return parts[0]
+    return None
+
+def _read_head_commit(git_dir, common_dir):
+    """Read the commit hash HEAD points to without spawning git"""
+    try:
+        value = _read_text(os.path.join(git_dir, 'HEAD')).strip()
+    except OSError:
+        return None
+    # Follow symbolic refs, with a limit in case of a loop
+    for _ in range(5):
+        if not value.startswith('ref:'):
+            return value or None
+        value = _resolve_ref(git_dir, common_dir, value[len('ref:'):].strip())
+        if value is None:
+            return None
+    return None
+
+# Bounds alternates chains, including accidental loops
+MAX_ALTERNATES = 5
+
+def _object_dirs(common_dir):
+    """List the object directories to search: the repo's own plus alternates.
+
+    Clones made with --shared or --reference keep most of their objects in
+    the directories named by objects/info/alternates.
+    """
+    dirs = [os.path.join(common_dir, 'objects')]
+    # Alternates may have alternates of their own; follow a few levels
+    for objects_dir in dirs:
+        if len(dirs) > MAX_ALTERNATES:
+            break
+        try:
+            alternates = _read_text(os.path.join(objects_dir, 'info', 'alternates'))
+        except OSError:
+            continue
+        for line in alternates.splitlines():
+            line = line.strip()
+            if line and not line.startswith('#'):
+                path = os.path.normpath(os.path.join(objects_dir, line))
+                if path not in dirs:
+                    dirs.append(path)
+    return dirs
+
+OBJECT_TYPES = {1: 'commit', 2: 'tree', 3: 'blob', 4: 'tag'}
+OFS_DELTA = 6
+REF_DELTA = 7
+# Git's default maximum delta chain is 50
+MAX_DELTA_DEPTH = 64
+
+def _inflate(f):
+    """Decompress one zlib stream starting at the file's current position"""
+    decompressor = zlib.decompressobj()
+    data = b''
+    while not decompressor.eof:
+        chunk = f.read(4096)
+        if not chunk:
+            raise ValueError("Truncated object")
+        data += decompressor.decompress(chunk)
+    return data
+
+def _apply_delta(base, delta):
+    """Rebuild an object from its base and a git delta"""
+    def varint(pos):
+        value = shift = 0
+        while True:
+            byte = delta[pos]
+            pos += 1
+            value |= (byte & 0x7f) << shift
+            shift += 7
+            if not byte & 0x80:
+                return value, pos
+
+    _, pos = varint(0)  # base size
+    _, pos = varint(pos)  # result size
+    out = bytearray()
+    while pos < len(delta):
+        op = delta[pos]
+        pos += 1
+        if op & 0x80:
+            # Copy a range of the base
+            offset = size = 0
+            for i in range(4):
+                if op & (1 << i):
+                    offset |= delta[pos] << (8 * i)
+                    pos += 1
+            for i in range(3):
+                if op & (1 << (4 + i)):
+                    size |= delta[pos] << (8 * i)
+                    pos += 1
+            out += base[offset:offset + (size or 0x10000)]
+        elif op:
+            # Insert the next op bytes literally
+            out += delta[pos:pos + op]
+            pos += op
+        else:
+            raise ValueError("Invalid delta instruction")
+    return bytes(out)
+
+def _find_in_index(idx_path, sha):
+    """Binary search a v2 pack index for an object's pack offset"""
+    with open(idx_path, 'rb') as f:
+        header = f.read(8)
+        if header[:4] != b'\xfftOc' or struct.unpack('>I', header[4:])[0] != 2:
+            return None
+        fanout = struct.unpack('>256I', f.read(1024))
+        count = fanout[255]
+        lo = fanout[sha[0] - 1] if sha[0] else 0
+        hi = fanout[sha[0]]
+        names_start = 8 + 1024
+        # 20-byte SHA-1 names, or 32-byte SHA-256 names
+        width = len(sha)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            f.seek(names_start + mid * width)
+            name = f.read(width)
+            if name < sha:
+                lo = mid + 1
+            elif name > sha:
+                hi = mid
+            else:
+                # Offsets follow the names and the CRC table
+                f.seek(names_start + count * (width + 4) + mid * 4)
+                offset = struct.unpack('>I', f.read(4))[0]
+                if offset & 0x80000000:
+                    f.seek(names_start + count * (width + 8) + (offset & 0x7fffffff) * 8)
+                    offset = struct.unpack('>Q', f.read(8))[0]
+                return offset
+    return None
+
+def _read_packed(object_dirs, pack_path, offset, width, depth):
+    """Read the object at offset in a pack, resolving deltas.
+
+    width is the object name length in bytes (20 for SHA-1, 32 for SHA-256).
+    """
+    if depth > MAX_DELTA_DEPTH:
+        raise ValueError("Delta chain too deep")
+    with open(pack_path, 'rb') as f:
+        f.seek(offset)
+        byte = f.read(1)[0]
+        obj_type = (byte >> 4) & 7
+        while byte & 0x80:
+            byte = f.read(1)[0]
+        base_offset = base_sha = None
+        if obj_type == OFS_DELTA:
+            byte = f.read(1)[0]
+            distance = byte & 0x7f
+            while byte & 0x80:
+                byte = f.read(1)[0]
+                distance = ((distance + 1) << 7) | (byte & 0x7f)
+            base_offset = offset - distance
+        elif obj_type == REF_DELTA:
+            base_sha = f.read(width).hex()
+        data = _inflate(f)
+
+    if base_offset is not None:
+        base = _read_packed(object_dirs, pack_path, base_offset, width, depth + 1)
+    elif base_sha is not None:
+        base = _read_object(object_dirs, base_sha, depth + 1)
+    else:
+        return OBJECT_TYPES.get(obj_type), data
+    if base is None:
+        return None
+    return base[0], _apply_delta(base[1], data)
+
+def _read_object(object_dirs, sha, depth=0):
+    """Read (type, data) for an object from loose storage or a pack"""
+    sha_bytes = bytes.fromhex(sha)
+    for objects_dir in object_dirs:
+        try:
+            with open(os.path.join(objects_dir, sha[:2], sha[2:]), 'rb') as f:
+                raw = zlib.decompress(f.read())
+        except FileNotFoundError:
+            pass
+        else:
+            header, _, data = raw.partition(b'\0')
+            return header.split(b' ')[0].decode('ascii'), data
+
+        pack_dir = os.path.join(objects_dir, 'pack')
+        try:
+            names = os.listdir(pack_dir)
+        except OSError:
+            continue
+        for name in names:
+            if name.endswith('.idx'):
+                offset = _find_in_index(os.path.join(pack_dir, name), sha_bytes)
+                if offset is not None:
+                    pack_path = os.path.join(pack_dir, name[:-len('.idx')] + '.pack')
+                    return _read_packed(object_dirs, pack_path, offset, len(sha_bytes), depth)
+    return None
+
+def _format_time(timestamp, offset):
+    """Format a git timestamp and '+hhmm' offset as ISO 8601"""
+    sign = -1 if offset < 0 else 1
+    offset = abs(offset)
+    tz = timezone(sign * timedelta(hours=offset // 100, minutes=offset % 100))
+    return datetime.fromtimestamp(timestamp, tz).isoformat()
+
+def _read_commit_time(common_dir, sha):
+    """Read the committer time of a commit from the object itself"""
+    obj = _read_object(_object_dirs(common_dir), sha)
+    if obj is None or obj[0] != 'commit':
+        return None
+    for line in obj[1].split(b'\n'):
+        if not line:
+            # End of the headers
+            break
+        if line.startswith(b'committer '):
+            # "committer Name <email> <timestamp> <tz>"
+            fields = line.rsplit(b' ', 2)
+            return _format_time(int(fields[1]), int(fields[2]))
+    return None
+
+def _read_remote(common_dir):
+    """Read the origin URL (or the first remote's) from the git config"""
+    urls = {}
+    section = None
+    try:
+        config = _read_text(os.path.join(common_dir, 'config'))
+    except OSError:
+        return None
+    for line in config.splitlines():
+        line = line.strip()
+        if line.startswith('['):
+            section = line.strip('[]')
+        elif section and section.startswith('remote ') and '=' in line:
+            key, value = (part.strip() for part in line.split('=', 1))
+            if key == 'url':
+                urls.setdefault(section[len('remote '):].strip('"'), value)
+    return urls.get('origin') or next(iter(urls.values()), None)
+
+def _dir_size(path):
+    """Total size in bytes of the files under path, not following symlinks"""
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total
+
+def repo_record(repo, root, decision):
+    """Build one inventory record for a repository"""
+    return _build_record(repo, root, decision)[0]
+
+def _build_record(repo, root, decision):
+    """Build (record, error) for a repository; error is None on success"""
+    repo, root = str(repo), str(root)
+    record = {
+        'name': os.path.basename(repo),
+        'path': os.path.relpath(repo, root),
+        'root': root,
+        'size_bytes': None,
+        'last_commit': None,
+        'last_commit_time': None,
+        'remote': None,
+        'decision': decision,
+    }
+    if not os.path.isdir(repo):
+        return record, None
+    try:
+        git_dir, common_dir = _git_dirs(repo)
+        commit = _read_head_commit(git_dir, common_dir)
+        metadata = {
+            'size_bytes': _dir_size(repo),
+            'last_commit': commit,
+            'last_commit_time': _read_commit_time(common_dir, commit) if commit else None,
+            'remote': _read_remote(common_dir),
+        }
+    except Exception as e:
+        # One damaged repository must not abort the export of the whole tree
+        return record, e
+    record.update(metadata)
+    return record, None
+
+def iter_inventory(entries, workers=8, failures=None):
+    """Yield inventory records in order for (repo, root, decision) entries.
+
+    Metadata is gathered on a worker pool, but only a small window of
+    repos is in flight at once so memory stays flat for any tree size.
+    Repos whose metadata couldn't be read are still yielded, with null
+    metadata, and (repo, error) is appended to failures if given.
+    """
+    def take():
+        repo, future = window.popleft()
+        record, error = future.result()
+        if error is not None and failures is not None:
+            failures.append((repo, error))
+        return record
+
+    window = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for repo, root, decision in entries:
+            window.append((repo, executor.submit(_build_record, repo, root, decision)))
+            if len(window) >= workers * 4:
+                yield take()
+        while window:
+            yield take()
+
+def _write_csv(records, output_path, progress):
+    count = 0
+    with open(output_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        for record in records:
+            writer.writerow(record)
+            count += 1
+            progress(count)
+    return count
+
+def _write_jsonl(records, output_path, progress):
+    count = 0
+    with open(output_path, 'w') as f:
+        for record in records:
+            f.write(json.dumps(record) + '\n')
+            count += 1
+            progress(count)
+    return count
+
+def _write_parquet(records, output_path, progress):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet export requires pyarrow (pip install pyarrow)")
+
+    schema = pa.schema([
+        ('name', pa.string()),
+        ('path', pa.string()),
+        ('root', pa.string()),
+        ('size_bytes', pa.int64()),
+        ('last_commit', pa.string()),
+        ('last_commit_time', pa.string()),
+        ('remote', pa.string()),
+        ('decision', pa.string()),
+    ])
+    count = 0
+    batch = []
+    with pq.ParquetWriter(output_path, schema, compression='zstd') as writer:
+        for record in records:
+            batch.append(record)
+            count += 1
+            progress(count)
+            if len(batch) >= PARQUET_BATCH_SIZE:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                batch = []
+        if batch:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+    return count
+
+def export_inventory(entries, output_path, fmt=None, workers=8, progress=None):
+    """Stream an inventory of (repo, root, decision) entries to output_path.
+
+    Returns (written, failures): the number of records written and the
+    (repo, error) pairs for repos exported with null metadata.
+    """
+    fmt = fmt or format_from_path(output_path)
+    writers = {'csv': _write_csv, 'jsonl': _write_jsonl, 'parquet': _write_parquet}
+    if fmt not in writers:
+        raise ValueError(f"Unknown export format: {fmt}")
+    failures = []
+    records = iter_inventory(entries, workers, failures)
+    written = writers[fmt](records, output_path, progress or (lambda count: None))
+    return written, failures
@@ -1,15 +1,22 @@
+import argparse
 import sys
+import threading
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QFileDialog, QMessageBox, QFrame, QStyle,
-    QDialog, QStyleFactory
+    QDialog, QStyleFactory, QCheckBox, QListWidget, QAbstractItemView,
+    QComboBox, QProgressBar
+)
+from PyQt6.QtCore import (
+    Qt, QTimer, QPropertyAnimation, QEasingCurve, QRect, QAbstractAnimation,
+    QItemSelection, QItemSelectionModel
 )
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QRect
 from PyQt6.QtGui import QFont, QIcon, QPalette, QColor
-from qt_material import apply_stylesheet, list_themes
 from config_manager import ConfigManager
 from repo_manager import RepoManager
+from inventory_exporter import FORMATS, export_inventory, format_from_path
+from theme_manager import THEMES, ThemeManager
 
 class AboutDialog(QDialog):
     def __init__(self, parent=None):
@@ -72,24 +79,34 @@ class AboutDialog(QDialog):
         layout.addWidget(repo)
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, theme_manager=None):
         super().__init__()
+        self.theme_manager = theme_manager or ThemeManager()
         self.config_manager = ConfigManager()
         self.repo_manager = RepoManager()
         self.current_theme = 'light_blue'
-        
-        base_path = self.config_manager.get_base_path()
-        print(f"Loaded base path from config: {base_path}")  # Debug print
-        if base_path:
-            self.repo_manager.set_base_path(base_path)
-            print(f"Total repositories found: {self.repo_manager.get_total_count()}")  # Debug print
+        self.review_active = False
+        self.export_state = None
+        self.bulk_delete = None
+        self.bulk_paths = []
+        self.locked_controls = []
+        
+        base_paths = self.config_manager.get_base_paths()
+        print(f"Loaded base paths from config: {base_paths}")  # Debug print
+        self.repo_manager.set_decisions(self.config_manager.load_decisions())
+        scan_settings = self.config_manager.get_scan_settings()
+        self.repo_manager.set_scan_mode(
+            scan_settings['mode'], scan_settings['concurrency'], scan_settings['timeout']
+        )
         
         self.init_ui()
         
-        # Update UI with the loaded path
-        if base_path:
+        # Start scanning the loaded paths and update the UI as roots finish
+        if base_paths:
+            self.repo_manager.set_base_paths(base_paths)
             self.update_path_label()
             self.update_repo_count()
+            self.scan_timer.start()
         
     def init_ui(self):
         self.setWindowTitle('GitHub Repository Pruner')
@@ -128,49 +145,18 @@ class MainWindow(QMainWindow):
         # Mode selection
         mode_frame = QFrame()
         mode_frame.setFrameStyle(QFrame.Shape.StyledPanel)
-        mode_frame.setStyleSheet("""
-            QFrame {
-                border-radius: 10px;
-                box-shadow: 2px 2px 5px #888888;
-            }
-        """)
+        mode_frame.setProperty('role', 'panel')
         mode_layout = QHBoxLayout(mode_frame)
         mode_layout.setSpacing(15)
         
         self.alpha_btn = QPushButton('Alphabetical Mode')
         self.alpha_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_ArrowDown))
         self.alpha_btn.setMinimumHeight(40)
-        self.alpha_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border-radius: 8px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-        """)
+        self.alpha_btn.setProperty('role', 'primary')
         self.random_btn = QPushButton('Random Mode')
         self.random_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserReload))
         self.random_btn.setMinimumHeight(40)
-        self.random_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border-radius: 8px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-        """)
+        self.random_btn.setProperty('role', 'primary')
         
         self.alpha_btn.clicked.connect(lambda: self.set_mode(False))
         self.random_btn.clicked.connect(lambda: self.set_mode(True))
@@ -181,86 +167,71 @@ class MainWindow(QMainWindow):
         # Settings section
         settings_frame = QFrame()
         settings_frame.setFrameStyle(QFrame.Shape.StyledPanel)
-        settings_frame.setStyleSheet("""
-            QFrame {
-                border-radius: 10px;
-                box-shadow: 2px 2px 5px #888888;
-            }
-        """)
+        settings_frame.setProperty('role', 'panel')
         settings_layout = QVBoxLayout(settings_frame)
         settings_layout.setSpacing(10)
         
-        path_header = QLabel('Repository Base Path')
+        path_header = QLabel('Repository Base Paths')
         path_header.setFont(QFont('Arial', 14, QFont.Weight.Bold))
         settings_layout.addWidget(path_header)
         
         self.path_label = QLabel('Not Set')
         self.path_label.setWordWrap(True)
         self.path_label.setFont(QFont('Arial', 12))
-        self.path_label.setStyleSheet("""
-            QLabel {
-                color: #000000;
-                background-color: #ffffff;
-                padding: 8px;
-                border-radius: 5px;
-                border: 1px solid #cccccc;
-            }
-        """)
+        self.path_label.setObjectName('pathLabel')
         settings_layout.addWidget(self.path_label)
         
-        set_path_btn = QPushButton('Set Base Path')
-        set_path_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon))
-        set_path_btn.setMinimumHeight(40)
-        set_path_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border-radius: 8px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-        """)
-        set_path_btn.clicked.connect(self.set_base_path)
-        settings_layout.addWidget(set_path_btn)
+        self.set_path_btn = QPushButton('Set Base Path')
+        self.set_path_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon))
+        self.set_path_btn.setMinimumHeight(40)
+        self.set_path_btn.setProperty('role', 'primary')
+        self.set_path_btn.clicked.connect(self.set_base_path)
+        
+        self.add_path_btn = QPushButton('Add Base Path')
+        self.add_path_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogNewFolder))
+        self.add_path_btn.setMinimumHeight(40)
+        self.add_path_btn.setProperty('role', 'primary')
+        self.add_path_btn.clicked.connect(self.add_base_path)
+        
+        path_buttons_layout = QHBoxLayout()
+        path_buttons_layout.setSpacing(15)
+        path_buttons_layout.addWidget(self.set_path_btn)
+        path_buttons_layout.addWidget(self.add_path_btn)
+        settings_layout.addLayout(path_buttons_layout)
+        
+        export_btn = QPushButton('Export Inventory')
+        export_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogSaveButton))
+        export_btn.setMinimumHeight(40)
+        export_btn.setProperty('role', 'primary')
+        export_btn.clicked.connect(self.export_inventory)
+        path_buttons_layout.addWidget(export_btn)
+        
+        self.network_mode_check = QCheckBox('Network filesystem mode (NFS/SSHFS)')
+        self.network_mode_check.setToolTip(
+            'Probe repositories concurrently with per-entry timeouts, for high-latency mounts'
+        )
+        self.network_mode_check.setChecked(self.repo_manager.scan_mode == 'network')
+        self.network_mode_check.toggled.connect(self.set_network_mode)
+        settings_layout.addWidget(self.network_mode_check)
         
         layout.addWidget(settings_frame)
         
         # Repository display
         self.repo_frame = QFrame()
         self.repo_frame.setFrameStyle(QFrame.Shape.StyledPanel)
-        self.repo_frame.setStyleSheet("""
-            QFrame {
-                border-radius: 10px;
-                box-shadow: 2px 2px 5px #888888;
-            }
-        """)
+        self.repo_frame.setProperty('role', 'panel')
         repo_layout = QVBoxLayout(self.repo_frame)
         repo_layout.setSpacing(10)
         
         self.repo_name_label = QLabel('Select a mode to start')
         self.repo_name_label.setFont(QFont('Arial', 18, QFont.Weight.Bold))
         self.repo_name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.repo_name_label.setStyleSheet("""
-            QLabel {
-                color: #2c3e50;
-                margin: 10px;
-            }
-        """)
+        self.repo_name_label.setObjectName('repoNameLabel')
         
         self.repo_path_label = QLabel('')
         self.repo_path_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.repo_path_label.setFont(QFont('Arial', 12))
-        self.repo_path_label.setStyleSheet("""
-            QLabel {
-                color: #7f8c8d;
-                margin: 5px;
-            }
-        """)
+        self.repo_path_label.setObjectName('repoPathLabel')
         
         repo_layout.addWidget(self.repo_name_label)
         repo_layout.addWidget(self.repo_path_label)
@@ -273,45 +244,71 @@ class MainWindow(QMainWindow):
         self.delete_btn = QPushButton('Delete')
         self.delete_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_TrashIcon))
         self.delete_btn.setMinimumHeight(40)
-        self.delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border-radius: 8px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:pressed {
-                background-color: #922b21;
-            }
-        """)
+        self.delete_btn.setProperty('role', 'danger')
         
         self.keep_btn = QPushButton('Keep')
         self.keep_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton))
         self.keep_btn.setMinimumHeight(40)
-        self.keep_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2ecc71;
-                color: white;
-                border-radius: 8px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #27ae60;
-            }
-            QPushButton:pressed {
-                background-color: #1e8449;
-            }
-        """)
+        self.keep_btn.setProperty('role', 'success')
         
         self.delete_btn.clicked.connect(self.delete_current_repo)
         self.keep_btn.clicked.connect(self.keep_current_repo)
         action_layout.addWidget(self.delete_btn)
         action_layout.addWidget(self.keep_btn)
+        
+        self.bulk_btn = QPushButton('Bulk Select')
+        self.bulk_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogListView))
+        self.bulk_btn.setMinimumHeight(40)
+        self.bulk_btn.setCheckable(True)
+        self.bulk_btn.setProperty('role', 'primary')
+        self.bulk_btn.toggled.connect(self.toggle_bulk_mode)
+        action_layout.addWidget(self.bulk_btn)
         layout.addLayout(action_layout)
         
+        # Bulk selection, hidden until Bulk Select is toggled on
+        self.bulk_frame = QFrame()
+        self.bulk_frame.setFrameStyle(QFrame.Shape.StyledPanel)
+        self.bulk_frame.setProperty('role', 'panel')
+        bulk_layout = QVBoxLayout(self.bulk_frame)
+        bulk_layout.setSpacing(10)
+        
+        bulk_hint = QLabel('Click, Shift+click or Ctrl+click to select repositories')
+        bulk_hint.setFont(QFont('Arial', 12))
+        bulk_layout.addWidget(bulk_hint)
+        
+        self.repo_list = QListWidget()
+        self.repo_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        # Uniform rows keep scrolling cheap with very large lists
+        self.repo_list.setUniformItemSizes(True)
+        self.repo_list.setMinimumHeight(200)
+        bulk_layout.addWidget(self.repo_list)
+        
+        bulk_actions_layout = QHBoxLayout()
+        bulk_actions_layout.setSpacing(15)
+        
+        self.storage_combo = QComboBox()
+        self.storage_combo.addItem('SSD (parallel deletes)', 'ssd')
+        self.storage_combo.addItem('HDD (fewer parallel deletes)', 'hdd')
+        storage_type = self.config_manager.get_delete_settings()['storage_type']
+        self.storage_combo.setCurrentIndex(self.storage_combo.findData(storage_type))
+        self.storage_combo.currentIndexChanged.connect(self.set_storage_type)
+        bulk_actions_layout.addWidget(self.storage_combo)
+        
+        self.delete_selected_btn = QPushButton('Delete Selected')
+        self.delete_selected_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_TrashIcon))
+        self.delete_selected_btn.setMinimumHeight(40)
+        self.delete_selected_btn.setProperty('role', 'danger')
+        self.delete_selected_btn.clicked.connect(self.delete_selected_repos)
+        bulk_actions_layout.addWidget(self.delete_selected_btn)
+        bulk_layout.addLayout(bulk_actions_layout)
+        
+        self.bulk_progress = QProgressBar()
+        self.bulk_progress.setVisible(False)
+        bulk_layout.addWidget(self.bulk_progress)
+        
+        self.bulk_frame.setVisible(False)
+        layout.addWidget(self.bulk_frame)
+        
         # Status message
         self.status_label = QLabel('')
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -327,45 +324,176 @@ class MainWindow(QMainWindow):
         self.status_timer = QTimer(self)
         self.status_timer.timeout.connect(self.clear_status)
         
+        # One slide-in animation, reused for every repo transition
+        self.repo_animation = QPropertyAnimation(self.repo_frame, b"geometry", self)
+        self.repo_animation.setDuration(300)
+        self.repo_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        
+        # Poll for base paths that have finished scanning
+        self.scan_timer = QTimer(self)
+        self.scan_timer.setInterval(100)
+        self.scan_timer.timeout.connect(self.poll_scan)
+        
+        # Poll a running bulk delete for progress
+        self.bulk_timer = QTimer(self)
+        self.bulk_timer.setInterval(200)
+        self.bulk_timer.timeout.connect(self.poll_bulk_delete)
+        
+        # Poll a running inventory export for progress
+        self.export_timer = QTimer(self)
+        self.export_timer.setInterval(200)
+        self.export_timer.timeout.connect(self.poll_export)
+        
         # Update UI state
         self.set_actions_enabled(False)
     
+    def export_inventory(self):
+        if self.export_state and not self.export_state['done']:
+            self.show_status('An export is already running')
+            return
+        if self.repo_manager.is_scanning():
+            QMessageBox.warning(self, 'Warning', 'Please wait for scanning to finish before exporting')
+            return
+        
+        filters = {
+            'CSV (*.csv)': 'csv',
+            'JSON Lines (*.jsonl)': 'jsonl',
+            'Parquet (*.parquet)': 'parquet',
+        }
+        path, selected_filter = QFileDialog.getSaveFileName(
+            self,
+            'Export Repository Inventory',
+            str(Path.home() / 'repo-inventory.csv'),
+            ';;'.join(filters)
+        )
+        if not path:
+            return
+        
+        # A typed extension wins over the selected filter, so the file's
+        # contents always match its name; without one, use the filter's
+        fmt = format_from_path(path, default=None)
+        if fmt is None:
+            fmt = filters.get(selected_filter, 'csv')
+            if not Path(path).suffix:
+                path += f'.{fmt}'
+        
+        # Snapshot on the GUI thread; the worker only reads the copy
+        entries = self.repo_manager.inventory_entries()
+        state = {'count': 0, 'failures': [], 'error': None, 'done': False, 'path': path}
+        
+        def run():
+            def progress(count):
+                state['count'] = count
+            try:
+                _, state['failures'] = export_inventory(entries, path, fmt, progress=progress)
+            except (OSError, ImportError, ValueError) as e:
+                state['error'] = e
+            state['done'] = True
+        
+        self.export_state = state
+        threading.Thread(target=run, name='inventory-export', daemon=True).start()
+        self.export_timer.start()
+    
+    def poll_export(self):
+        state = self.export_state
+        if not state['done']:
+            self.show_status(f"Exporting inventory: {state['count']} repositories written")
+            return
+        self.export_timer.stop()
+        if state['error']:
+            QMessageBox.warning(self, 'Error', f"Export failed: {state['error']}")
+        elif state['failures']:
+            path, error = state['failures'][0]
+            self.show_status(
+                f"Exported {state['count']} repositories to {state['path']}; "
+                f"metadata missing for {len(state['failures'])}, e.g. {path}: {error}", 5000)
+        else:
+            self.show_status(f"Exported {state['count']} repositories to {state['path']}", 3000)
+    
     def show_about(self):
         dialog = AboutDialog(self)
         dialog.exec()
     
     def set_mode(self, random_mode):
-        if not self.repo_manager.base_path:
+        if not self.repo_manager.base_paths:
             QMessageBox.warning(self, 'Warning', 'Please set base path first')
             return
             
         self.repo_manager.set_random_mode(random_mode)
         self.alpha_btn.setEnabled(not random_mode)
         self.random_btn.setEnabled(random_mode)
+        self.review_active = True
+        self.update_repo_count()
         self.load_current_repo()
-        self.set_actions_enabled(True)
+        self.scan_timer.start()
     
     def set_base_path(self):
+        path = self.choose_directory()
+        if path:
+            self.apply_base_paths(self.config_manager.set_base_path, path,
+                                  'Base path updated successfully')
+    
+    def add_base_path(self):
+        path = self.choose_directory()
+        if path:
+            self.apply_base_paths(self.config_manager.add_base_path, path,
+                                  'Base path added successfully')
+    
+    def choose_directory(self):
         dialog = QFileDialog()
-        path = dialog.getExistingDirectory(
+        return dialog.getExistingDirectory(
             self,
             'Select Base Repository Directory',
             str(Path.home())
         )
-        
-        if path:
-            try:
-                self.config_manager.set_base_path(path)
-                self.repo_manager.set_base_path(path)
-                self.update_path_label()
-                self.update_repo_count()
-                self.show_status('Base path updated successfully')
-            except ValueError as e:
-                QMessageBox.warning(self, 'Error', str(e))
+    
+    def apply_base_paths(self, update_config, path, message):
+        try:
+            update_config(path)
+        except ValueError as e:
+            QMessageBox.warning(self, 'Error', str(e))
+            return
+        self.repo_manager.set_base_paths(self.config_manager.get_base_paths())
+        self.update_path_label()
+        self.update_repo_count()
+        self.scan_timer.start()
+        if self.review_active:
+            self.load_current_repo()
+        self.show_status(message)
+    
+    def set_network_mode(self, enabled):
+        mode = 'network' if enabled else 'local'
+        self.config_manager.set_scan_settings(mode)
+        self.repo_manager.set_scan_mode(mode)
+        if self.repo_manager.base_paths:
+            self.repo_manager.refresh_repos()
+            self.update_repo_count()
+            self.scan_timer.start()
+            if self.review_active:
+                self.load_current_repo()
+        self.show_status(f'Scan mode set to {mode}')
+    
+    def poll_scan(self):
+        changed = self.repo_manager.collect_scan_results()
+        scanning = self.repo_manager.is_scanning()
+        if changed or not scanning:
+            self.update_repo_count()
+            if self.bulk_frame.isVisible():
+                self.populate_repo_list()
+            # Show the first repo as soon as any root delivers one, unless a
+            # bulk delete is running and review is locked until it finishes
+            if self.review_active and not self.bulk_delete and not self.delete_btn.isEnabled():
+                self.load_current_repo()
+        if not scanning:
+            self.scan_timer.stop()
+            errors = self.repo_manager.scan_errors
+            if errors:
+                path, error = errors[0]
+                self.show_status(f'Could not scan {len(errors)} path(s), e.g. {path}: {error}', 3000)
     
     def update_path_label(self):
-        base_path = self.repo_manager.base_path
-        path_text = str(base_path or "Not Set")
+        base_paths = self.repo_manager.base_paths
+        path_text = '\n'.join(str(p) for p in base_paths) or "Not Set"
         print(f"Updating path label to: {path_text}")  # Debug print
         self.path_label.setText(path_text)
     
@@ -374,7 +502,12 @@ class MainWindow(QMainWindow):
         if repo:
             self.repo_name_label.setText(repo['name'])
             self.repo_path_label.setText(repo['path'])
+            self.set_actions_enabled(True)
             self.animate_repo_frame()
+        elif self.repo_manager.is_scanning():
+            self.set_actions_enabled(False)
+            self.repo_name_label.setText('Scanning repositories...')
+            self.repo_path_label.setText('')
         else:
             if not self.repo_manager._random_mode:
                 self.show_status('End of repositories reached')
@@ -383,18 +516,147 @@ class MainWindow(QMainWindow):
             self.repo_path_label.setText('')
     
     def delete_current_repo(self):
+        repo = self.repo_manager.get_current_repo()
         if self.repo_manager.delete_current_repo():
+            self.config_manager.record_decisions([(repo['full_path'], repo['root'], 'delete')])
             self.show_status('Repository deleted')
             self.update_repo_count()
+            if self.bulk_frame.isVisible():
+                self.populate_repo_list()
             self.load_current_repo()
     
+    def toggle_bulk_mode(self, enabled):
+        self.bulk_frame.setVisible(enabled)
+        if enabled:
+            self.populate_repo_list()
+    
+    def populate_repo_list(self):
+        if self.bulk_delete:
+            # Rows must keep matching bulk_paths until the delete finishes
+            return
+        
+        # Rebuilding drops the selection, so carry it over by path
+        selected = {self.bulk_paths[index.row()] for index in self.repo_list.selectedIndexes()}
+        current_row = self.repo_list.currentRow()
+        current = self.bulk_paths[current_row] if current_row >= 0 else None
+        
+        self.bulk_paths = self.repo_manager.get_repo_paths()
+        self.repo_list.clear()
+        self.repo_list.addItems([str(path) for path in self.bulk_paths])
+        if not selected and current is None:
+            return
+        
+        # Select contiguous runs as ranges; one call instead of one per item
+        model = self.repo_list.model()
+        selection = QItemSelection()
+        run_start = None
+        for row, path in enumerate(self.bulk_paths + [None]):
+            if path is not None and path in selected:
+                if run_start is None:
+                    run_start = row
+            elif run_start is not None:
+                selection.select(model.index(run_start, 0), model.index(row - 1, 0))
+                run_start = None
+        selection_model = self.repo_list.selectionModel()
+        if current in self.bulk_paths:
+            # Keeps the Shift+click anchor where the user left it
+            selection_model.setCurrentIndex(
+                model.index(self.bulk_paths.index(current), 0),
+                QItemSelectionModel.SelectionFlag.NoUpdate
+            )
+        selection_model.select(selection, QItemSelectionModel.SelectionFlag.Select)
+    
+    def set_storage_type(self, index):
+        self.config_manager.set_delete_settings(self.storage_combo.itemData(index))
+    
+    def delete_selected_repos(self):
+        rows = sorted(index.row() for index in self.repo_list.selectedIndexes())
+        if not rows:
+            self.show_status('No repositories selected')
+            return
+        
+        paths = [self.bulk_paths[row] for row in rows]
+        reply = QMessageBox.question(
+            self,
+            'Delete Repositories',
+            f'Permanently delete {len(paths)} repositories?'
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        
+        workers = self.config_manager.get_delete_settings()['workers']
+        self.bulk_delete = self.repo_manager.start_bulk_delete(paths, workers)
+        self.bulk_progress.setRange(0, len(paths))
+        self.bulk_progress.setValue(0)
+        self.bulk_progress.setVisible(True)
+        self.set_actions_enabled(False)
+        self.lock_controls()
+        self.bulk_timer.start()
+    
+    def lock_controls(self):
+        # Anything that would rescan or delete stays off until the pool is done
+        controls = [
+            self.alpha_btn, self.random_btn, self.set_path_btn, self.add_path_btn,
+            self.network_mode_check, self.storage_combo, self.repo_list,
+            self.delete_selected_btn
+        ]
+        self.locked_controls = [(control, control.isEnabled()) for control in controls]
+        for control in controls:
+            control.setEnabled(False)
+    
+    def unlock_controls(self):
+        for control, enabled in self.locked_controls:
+            control.setEnabled(enabled)
+        self.locked_controls = []
+    
+    def poll_bulk_delete(self):
+        bulk = self.bulk_delete
+        progress = bulk.get_progress()
+        self.bulk_progress.setValue(progress['repos'])
+        self.bulk_progress.setFormat(
+            f"%v/%m repos - {progress['repos_per_sec']:.1f} repos/s, "
+            f"{progress['files_per_sec']:.0f} files/s, "
+            f"{progress['bytes_per_sec'] / 1024 / 1024:.1f} MB/s"
+        )
+        if not bulk.is_finished():
+            return
+        
+        self.bulk_timer.stop()
+        self.bulk_delete = None
+        decisions = self.repo_manager.finish_bulk_delete(bulk)
+        self.config_manager.record_decisions(decisions)
+        self.unlock_controls()
+        self.populate_repo_list()
+        self.update_repo_count()
+        if self.review_active:
+            self.load_current_repo()
+        
+        if bulk.failures:
+            box = QMessageBox(self)
+            box.setIcon(QMessageBox.Icon.Warning)
+            box.setWindowTitle('Bulk Delete')
+            box.setText(
+                f'Deleted {len(bulk.deleted)} repositories; '
+                f'{len(bulk.failures)} could not be deleted.'
+            )
+            box.setDetailedText('\n'.join(f'{path}: {error}' for path, error in bulk.failures))
+            box.exec()
+        else:
+            self.show_status(f'Deleted {len(bulk.deleted)} repositories', 3000)
+    
     def keep_current_repo(self):
-        self.repo_manager.next_repo()
+        repo = self.repo_manager.get_current_repo()
+        self.repo_manager.keep_current_repo()
+        if repo:
+            self.config_manager.record_decisions([(repo['full_path'], repo['root'], 'keep')])
         self.load_current_repo()
     
     def update_repo_count(self):
         count = self.repo_manager.get_total_count()
-        self.count_label.setText(f'Total Repositories: {count}')
+        if self.repo_manager.is_scanning():
+            self.count_label.setText(f'Total Repositories: {count} (scanning...)')
+        else:
+            self.count_label.setText(f'Total Repositories: {count}')
     
     def show_status(self, message, duration=1000):
         self.status_label.setText(message)
@@ -405,63 +667,29 @@ class MainWindow(QMainWindow):
         self.status_timer.stop()
     
     def set_actions_enabled(self, enabled):
+        # Delete and Keep stay off while a bulk delete owns the repo list
+        enabled = enabled and not self.bulk_delete
         self.delete_btn.setEnabled(enabled)
         self.keep_btn.setEnabled(enabled)
 
     def toggle_theme(self):
-        themes = ['light_blue', 'dark_blue']
-        current_index = themes.index(self.current_theme)
-        self.current_theme = themes[(current_index + 1) % len(themes)]
-        apply_stylesheet(QApplication.instance(), theme=f'{self.current_theme}.xml')
+        current_index = THEMES.index(self.current_theme)
+        self.current_theme = THEMES[(current_index + 1) % len(THEMES)]
+        self.theme_manager.apply(QApplication.instance(), self.current_theme)
         
-        # Additional stylesheet for better text contrast and consistent styling
         if self.current_theme.startswith('light'):
-            QApplication.instance().setStyleSheet("""
-                QLabel { color: #000000; }
-                QPushButton { 
-                    color: #000000;
-                    border-radius: 5px;
-                    padding: 5px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(0, 0, 0, 0.1);
-                }
-                QMainWindow { background-color: #ffffff; }
-                QFrame {
-                    border-radius: 8px;
-                    background-color: rgba(255, 255, 255, 0.8);
-                    border: 1px solid #dddddd;
-                    box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-                }
-            """)
             self.theme_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_TitleBarShadeButton))  # Sun icon
         else:
-            QApplication.instance().setStyleSheet("""
-                QLabel { color: #ffffff; }
-                QPushButton { 
-                    color: #ffffff;
-                    border-radius: 5px;
-                    padding: 5px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(255, 255, 255, 0.1);
-                }
-                QMainWindow { background-color: #2d2d2d; }
-                QFrame {
-                    border-radius: 8px;
-                    background-color: rgba(45, 45, 45, 0.8);
-                    border: 1px solid #444444;
-                    box-shadow: 0 2px 4px rgba(0, 0, 0, 0.2);
-                }
-            """)
             self.theme_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_TitleBarUnshadeButton))  # Moon icon
 
     def animate_repo_frame(self):
-        animation = QPropertyAnimation(self.repo_frame, b"geometry")
-        animation.setDuration(300)
-        animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        
-        current_geometry = self.repo_frame.geometry()
+        animation = self.repo_animation
+        if animation.state() == QAbstractAnimation.State.Running:
+            # Restart from where the frame belongs, not from mid-slide
+            animation.stop()
+            current_geometry = animation.endValue()
+        else:
+            current_geometry = self.repo_frame.geometry()
         start_geometry = QRect(current_geometry.x() + 50, current_geometry.y(),
                              current_geometry.width(), current_geometry.height())
         
@@ -469,29 +697,53 @@ class MainWindow(QMainWindow):
         animation.setEndValue(current_geometry)
         animation.start()
 
+def export_cli(output_path, fmt=None):
+    """Scan the configured base paths and export the inventory without the GUI"""
+    config_manager = ConfigManager()
+    repo_manager = RepoManager()
+    scan_settings = config_manager.get_scan_settings()
+    repo_manager.set_scan_mode(
+        scan_settings['mode'], scan_settings['concurrency'], scan_settings['timeout']
+    )
+    
+    base_paths = config_manager.get_base_paths()
+    if not base_paths:
+        print("Error: no base path configured", file=sys.stderr)
+        return 1
+    repo_manager.set_decisions(config_manager.load_decisions())
+    repo_manager.set_base_paths(base_paths)
+    repo_manager.wait_for_scan()
+    for path, error in repo_manager.scan_errors:
+        print(f"Warning: could not scan {path}: {error}", file=sys.stderr)
+    
+    try:
+        count, failures = export_inventory(repo_manager.inventory_entries(), output_path, fmt)
+    except (OSError, ImportError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    for path, error in failures:
+        print(f"Warning: could not read metadata for {path}: {error}", file=sys.stderr)
+    print(f"Exported {count} repositories to {output_path}")
+    return 0
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='Review and prune local GitHub repositories')
+    parser.add_argument('--export', metavar='PATH',
+                        help='export the repository inventory to PATH and exit')
+    parser.add_argument('--format', choices=FORMATS,
+                        help='export format (default: guessed from the file extension)')
+    # Anything unrecognised is left for Qt (e.g. -platform)
+    return parser.parse_known_args(argv)
+
 def main():
-    app = QApplication(sys.argv)
-    apply_stylesheet(app, theme='light_blue.xml')
-    # Additional stylesheet for better text contrast and consistent styling
-    app.setStyleSheet("""
-        QLabel { color: #000000; }
-        QPushButton { 
-            color: #000000;
-            border-radius: 5px;
-            padding: 5px;
-        }
-        QPushButton:hover {
-            background-color: rgba(0, 0, 0, 0.1);
-        }
-        QMainWindow { background-color: #ffffff; }
-        QFrame {
-            border-radius: 8px;
-            background-color: rgba(255, 255, 255, 0.8);
-            border: 1px solid #dddddd;
-            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-        }
-    """)
-    window = MainWindow()
+    args, qt_args = parse_args(sys.argv[1:])
+    if args.export:
+        sys.exit(export_cli(args.export, args.format))
+    
+    app = QApplication(sys.argv[:1] + qt_args)
+    theme_manager = ThemeManager()
+    theme_manager.apply(app, 'light_blue')
+    window = MainWindow(theme_manager)
     window.show()
     sys.exit(app.exec())
 
@@ -1,37 +1,410 @@
+import heapq
+import itertools
 import os
+import queue
 import random
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import shutil
 
+SCAN_MODES = ('local', 'network')
+
+def _sort_key(path):
+    """Alphabetical key by folder name, so repos from every root interleave"""
+    return (path.name, str(path))
+
+def scan_root_local(root, scandir=os.scandir, exists=os.path.exists):
+    """List the git repositories directly under root, sorted by name"""
+    with scandir(root) as entries:
+        # DirEntry.is_dir() answers from d_type without an extra stat
+        repos = [
+            Path(entry.path) for entry in entries
+            if entry.is_dir() and exists(os.path.join(entry.path, '.git'))
+        ]
+    repos.sort(key=_sort_key)
+    return repos
+
+def _list_candidates(root, timeout, scandir=os.scandir):
+    """List root's subdirectories and symlinks, giving up after timeout seconds"""
+    result = queue.SimpleQueue()
+    
+    def list_root():
+        try:
+            with scandir(root) as entries:
+                # Symlinks would need a stat to resolve; the '.git' probe covers them
+                result.put((True, [
+                    Path(entry.path) for entry in entries
+                    if entry.is_dir(follow_symlinks=False) or entry.is_symlink()
+                ]))
+        except (FileNotFoundError, NotADirectoryError):
+            result.put((True, []))
+        except OSError as e:
+            result.put((False, e))
+    
+    threading.Thread(target=list_root, name='repo-list', daemon=True).start()
+    try:
+        ok, value = result.get(timeout=timeout)
+    except queue.Empty:
+        raise TimeoutError(f"Timed out listing {root}")
+    if not ok:
+        raise value
+    return value
+
+def scan_root_network(root, max_in_flight=16, timeout=5.0,
+                      scandir=os.scandir, exists=os.path.exists):
+    """List the git repositories under root on a high-latency filesystem.
+    
+    The directory is listed once and d_type filters out plain files without
+    a round trip. The '.git' probes are the only per-entry requests, with at
+    most max_in_flight outstanding, counting probes that have been abandoned
+    but not yet answered. A probe that takes longer than timeout seconds is
+    reported as timed out so one hung entry doesn't stall the scan; if every
+    probe slot is stuck, or the listing itself times out, the whole root
+    fails with TimeoutError.
+    
+    Returns (repos, timed_out): the sorted repositories and the entries
+    whose probe was abandoned.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    if timeout <= 0:
+        raise ValueError("timeout must be positive")
+    
+    candidates = _list_candidates(root, timeout, scandir)
+    
+    todo = queue.SimpleQueue()
+    for path in candidates:
+        todo.put(path)
+    done = queue.SimpleQueue()
+    lock = threading.Lock()
+    in_flight = {}
+    abandoned = set()
+    
+    def probe():
+        while True:
+            try:
+                path = todo.get_nowait()
+            except queue.Empty:
+                return
+            with lock:
+                in_flight[path] = time.monotonic()
+            try:
+                found = exists(os.path.join(path, '.git'))
+            except OSError:
+                found = False
+            with lock:
+                in_flight.pop(path, None)
+                if path in abandoned:
+                    # Already reported as timed out; the slot is free again
+                    abandoned.discard(path)
+                    continue
+            done.put((path, found))
+    
+    # A fixed set of workers: a stuck probe keeps holding its slot, so the
+    # server never sees more than `workers` outstanding requests.
+    # Daemon threads, so a probe stuck on a dead server can't block exit
+    workers = min(max_in_flight, len(candidates))
+    for _ in range(workers):
+        threading.Thread(target=probe, name='repo-probe', daemon=True).start()
+    
+    repos = []
+    timed_out = []
+    remaining = len(candidates)
+    poll_interval = min(0.05, timeout)
+    while remaining:
+        try:
+            path, found = done.get(timeout=poll_interval)
+            remaining -= 1
+            if found:
+                repos.append(path)
+        except queue.Empty:
+            pass
+        
+        now = time.monotonic()
+        with lock:
+            expired = [
+                p for p, started in in_flight.items()
+                if p not in abandoned and now - started > timeout
+            ]
+            abandoned.update(expired)
+            stuck = len(abandoned)
+        timed_out.extend(expired)
+        remaining -= len(expired)
+        
+        if remaining and stuck >= workers:
+            raise TimeoutError(
+                f"Timed out scanning {root}: all {workers} probes are stuck"
+            )
+    
+    repos.sort(key=_sort_key)
+    return repos, timed_out
+
+def remove_tree(path, progress=None):
+    """Delete a directory tree, reporting (files, bytes) removed per directory.
+    
+    Like shutil.rmtree, stops at the first error, but also tallies what it
+    removes so callers can show files and bytes per second.
+    """
+    def unlink(file_path):
+        try:
+            os.unlink(file_path)
+        except PermissionError:
+            # Read-only files (e.g. git objects on Windows) need write permission
+            os.chmod(file_path, stat.S_IWRITE)
+            os.unlink(file_path)
+    
+    if os.path.islink(path):
+        # Same as shutil.rmtree: never delete through a link to elsewhere
+        raise OSError(f"Cannot delete a symbolic link: {path}")
+    
+    stack = [(os.fspath(path), False)]
+    while stack:
+        dir_path, listed = stack.pop()
+        if listed:
+            os.rmdir(dir_path)
+            continue
+        stack.append((dir_path, True))
+        files = 0
+        size = 0
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, False))
+                else:
+                    size += entry.stat(follow_symlinks=False).st_size
+                    unlink(entry.path)
+                    files += 1
+        if progress and files:
+            progress(files, size)
+
+class BulkDelete:
+    """Deletes many repositories on a worker pool with aggregate progress"""
+    def __init__(self, paths, workers):
+        self.paths = list(paths)
+        self.workers = max(1, workers)
+        self.repos_done = 0
+        self.files_done = 0
+        self.bytes_done = 0
+        self.deleted = []
+        self.failures = []
+        self._lock = threading.Lock()
+        self._started = None
+        self._finished = threading.Event()
+    
+    def start(self):
+        """Start deleting in the background"""
+        self._started = time.monotonic()
+        if not self.paths:
+            self._finished.set()
+            return
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='repo-delete')
+        for path in self.paths:
+            executor.submit(self._delete_one, path)
+        executor.shutdown(wait=False)
+    
+    def _delete_one(self, path):
+        try:
+            remove_tree(path, self._add_progress)
+        except OSError as e:
+            with self._lock:
+                self.failures.append((path, e))
+        else:
+            with self._lock:
+                self.deleted.append(path)
+        finally:
+            with self._lock:
+                self.repos_done += 1
+                if self.repos_done == len(self.paths):
+                    self._finished.set()
+    
+    def _add_progress(self, files, size):
+        with self._lock:
+            self.files_done += files
+            self.bytes_done += size
+    
+    def is_finished(self):
+        """Check if every repository has been attempted"""
+        return self._finished.is_set()
+    
+    def wait(self, timeout=None):
+        """Block until every repository has been attempted"""
+        return self._finished.wait(timeout)
+    
+    def get_progress(self):
+        """Get counts so far and rates per second"""
+        with self._lock:
+            repos, files, size = self.repos_done, self.files_done, self.bytes_done
+        elapsed = max(time.monotonic() - self._started, 1e-6) if self._started else 0
+        return {
+            'repos': repos,
+            'total': len(self.paths),
+            'files': files,
+            'bytes': size,
+            'repos_per_sec': repos / elapsed if elapsed else 0.0,
+            'files_per_sec': files / elapsed if elapsed else 0.0,
+            'bytes_per_sec': size / elapsed if elapsed else 0.0,
+        }
+
 class RepoManager:
     def __init__(self, base_path=None):
-        self.base_path = Path(base_path) if base_path else None
+        self.base_paths = [Path(base_path)] if base_path else []
         self._repos_list = []
+        self._repo_roots = {}
         self._current_index = 0
+        self._current_shown = False
         self._random_mode = False
+        self._scan_results = queue.Queue()
+        self._pending_roots = 0
+        self.scan_errors = []
+        self._decisions = {}
+        self._deleted = {}
+        self.scan_mode = 'local'
+        self.scan_concurrency = 16
+        self.scan_timeout = 5.0
+    
+    @property
+    def base_path(self):
+        """First configured base path"""
+        return self.base_paths[0] if self.base_paths else None
         
     def set_base_path(self, path):
-        """Set the base path and refresh repository list"""
-        self.base_path = Path(path)
+        """Set a single base path and refresh repository list"""
+        self.set_base_paths([path])
+    
+    def set_scan_mode(self, mode, concurrency=None, timeout=None):
+        """Choose how base paths are scanned; 'network' suits NFS/SSHFS mounts"""
+        if mode not in SCAN_MODES:
+            raise ValueError(f"Unknown scan mode: {mode}")
+        self.scan_mode = mode
+        if concurrency is not None:
+            if concurrency < 1:
+                raise ValueError("Scan concurrency must be at least 1")
+            self.scan_concurrency = concurrency
+        if timeout is not None:
+            if timeout <= 0:
+                raise ValueError("Scan timeout must be positive")
+            self.scan_timeout = timeout
+    
+    def set_base_paths(self, paths):
+        """Set the base paths and refresh repository list"""
+        # The same root given twice (e.g. '/x' and '/x/') is only scanned once
+        unique = dict.fromkeys(os.path.realpath(p) for p in paths)
+        self.base_paths = [Path(p) for p in unique]
         self.refresh_repos()
     
     def refresh_repos(self):
-        """Refresh the list of repositories"""
-        if not self.base_path or not self.base_path.exists():
-            self._repos_list = []
+        """Start scanning every base path, one worker per root.
+        
+        Results are merged into the review list by collect_scan_results()
+        as each root finishes, so a slow disk doesn't hold up the others.
+        """
+        self._reset_list()
+        self._pending_roots = len(self.base_paths)
+        if not self.base_paths:
             return
-            
-        self._repos_list = [
-            d for d in self.base_path.iterdir()
-            if d.is_dir() and (d / '.git').exists()
-        ]
+        
+        results = self._scan_results
+        executor = ThreadPoolExecutor(
+            max_workers=len(self.base_paths), thread_name_prefix='repo-scan'
+        )
+        for root in self.base_paths:
+            future = executor.submit(self._scan_root, root)
+            future.add_done_callback(lambda f, root=root: results.put((root, f)))
+        executor.shutdown(wait=False)
+    
+    def _reset_list(self):
+        """Empty the review list and forget any scan in progress"""
+        # A fresh queue means results from an abandoned scan are never merged
+        self._scan_results = queue.Queue()
+        self._repos_list = []
+        self._repo_roots = {}
+        self._current_index = 0
+        self._current_shown = False
+        self._pending_roots = 0
+        self.scan_errors = []
+    
+    def load_repos(self, repos):
+        """Replace the review list with known (repo, root) pairs, without scanning.
+        
+        Useful for restoring or simulating a session; the list is ordered
+        the same way a scan would order it.
+        """
+        self._reset_list()
+        by_root = {}
+        for repo, root in repos:
+            by_root.setdefault(Path(root), []).append(Path(repo))
+        self.base_paths = list(by_root)
+        for root, root_repos in by_root.items():
+            self._merge_repos(root, sorted(root_repos, key=_sort_key))
+    
+    def _scan_root(self, root):
+        """Scan one root with the configured mode, returning (repos, timed_out)"""
+        if self.scan_mode == 'network':
+            # No is_dir() here: on a hung mount it would block without a timeout
+            return scan_root_network(root, self.scan_concurrency, self.scan_timeout)
+        if not root.is_dir():
+            # Reported through scan_errors so a whole root isn't skipped silently
+            raise FileNotFoundError(f"Base path not found: {root}")
+        return scan_root_local(root), []
+    
+    def collect_scan_results(self, block=False):
+        """Merge finished root scans into the review list.
+        
+        With block=True, waits until every root has been scanned.
+        Returns True if the repository list changed.
+        """
+        changed = False
+        while self._pending_roots:
+            try:
+                root, future = self._scan_results.get(block=block)
+            except queue.Empty:
+                break
+            self._pending_roots -= 1
+            try:
+                repos, timed_out = future.result()
+            except OSError as e:
+                self.scan_errors.append((root, e))
+                continue
+            for path in timed_out:
+                self.scan_errors.append((path, TimeoutError('Timed out checking for .git')))
+            if repos:
+                self._merge_repos(root, repos)
+                changed = True
+        return changed
+    
+    def wait_for_scan(self):
+        """Block until every base path has been scanned"""
+        self.collect_scan_results(block=True)
+    
+    def is_scanning(self):
+        """Check if any base path is still being scanned"""
+        return self._pending_roots > 0
+    
+    def _merge_repos(self, root, repos):
+        """Merge one root's sorted repos into the unreviewed part of the list"""
+        # Overlapping roots can report the same repo twice; keep the first
+        repos = [repo for repo in repos if repo not in self._repo_roots]
+        if not repos:
+            return
+        for repo in repos:
+            self._repo_roots[repo] = root
+        
+        # Repos already passed, and the one on screen, stay where they are
+        split = self._current_index + (1 if self._current_shown else 0)
+        split = min(split, len(self._repos_list))
+        reviewed = self._repos_list[:split]
+        remaining = self._repos_list[split:]
         
         if not self._random_mode:
-            self._repos_list.sort()
+            remaining = list(heapq.merge(remaining, repos, key=_sort_key))
         else:
-            random.shuffle(self._repos_list)
-            
-        self._current_index = 0
+            remaining.extend(repos)
+            random.shuffle(remaining)
+        
+        self._repos_list = reviewed + remaining
     
     def set_random_mode(self, enabled):
         """Set random mode and refresh repository list"""
@@ -48,9 +421,12 @@ class RepoManager:
             return None
             
         repo_path = self._repos_list[self._current_index]
+        root = self._repo_roots[repo_path]
+        self._current_shown = True
         return {
             'name': self._prettify_name(repo_path.name),
-            'path': str(repo_path.relative_to(self.base_path)),
+            'path': str(repo_path.relative_to(root)),
+            'root': str(root),
             'full_path': str(repo_path)
         }
     
@@ -70,12 +446,88 @@ class RepoManager:
         try:
             shutil.rmtree(repo_path)
             self._repos_list.pop(self._current_index)
+            root = self._repo_roots.pop(repo_path, None)
+            self._decisions[repo_path] = 'delete'
+            self._deleted[repo_path] = root
             # Don't increment index as the next repo slides into current position
             return True
         except Exception as e:
             print(f"Error deleting repository: {e}")
             return False
     
+    def get_repo_paths(self):
+        """Get a copy of the repository list in review order"""
+        return list(self._repos_list)
+    
+    def start_bulk_delete(self, paths, workers):
+        """Start deleting several repositories in parallel.
+        
+        Call finish_bulk_delete() with the returned BulkDelete once it has
+        finished to drop the deleted repos from the review list.
+        """
+        bulk = BulkDelete(paths, workers)
+        bulk.start()
+        return bulk
+    
+    def finish_bulk_delete(self, bulk):
+        """Remove the repos a finished BulkDelete deleted from the review list.
+        
+        Returns the (repo, root, 'delete') decisions it recorded.
+        """
+        deleted = set(bulk.deleted)
+        if not deleted:
+            return []
+        # Repos ahead of the cursor that were deleted shift it back
+        self._current_index -= sum(
+            1 for repo in self._repos_list[:self._current_index] if repo in deleted
+        )
+        self._repos_list = [repo for repo in self._repos_list if repo not in deleted]
+        decisions = []
+        for repo in bulk.deleted:
+            root = self._repo_roots.pop(repo, None)
+            self._decisions[repo] = 'delete'
+            self._deleted[repo] = root
+            decisions.append((repo, root, 'delete'))
+        return decisions
+    
+    def keep_current_repo(self):
+        """Record the current repository as kept and move to next"""
+        if self._current_index < len(self._repos_list):
+            self._decisions[self._repos_list[self._current_index]] = 'keep'
+        return self.next_repo()
+    
+    def set_decisions(self, decisions):
+        """Restore review decisions saved as {path: (root, decision)}"""
+        self._decisions = {Path(path): decision for path, (root, decision) in decisions.items()}
+        self._deleted = {
+            Path(path): Path(root) if root else None
+            for path, (root, decision) in decisions.items() if decision == 'delete'
+        }
+    
+    def inventory_entries(self):
+        """Snapshot (repo, root, decision) for every repo listed or deleted.
+        
+        The lists are copied up front so the result can be consumed on
+        another thread while review carries on.
+        """
+        roots = dict(self._repo_roots)
+        decisions = dict(self._decisions)
+        
+        def listed_decision(repo):
+            decision = decisions.get(repo, 'pending')
+            # A repo deleted earlier that is back on disk has been re-cloned
+            return 'pending' if decision == 'delete' else decision
+        
+        current = (
+            (repo, roots[repo], listed_decision(repo))
+            for repo in list(self._repos_list)
+        )
+        deleted = (
+            (repo, root, 'delete') for repo, root in list(self._deleted.items())
+            if repo not in roots
+        )
+        return itertools.chain(current, deleted)
+    
     def next_repo(self):
         """Move to next repository"""
         if self._random_mode and self._repos_list:
@@ -17,7 +17,9 @@ a = Analysis(
         'PyQt6.QtGui', 
         'PyQt6.QtWidgets',
         'config_manager',
-        'repo_manager'
+        'repo_manager',
+        'inventory_exporter',
+        'theme_manager'
     ],
     hookspath=[],
     hooksconfig={},
@@ -0,0 +1,19 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# The modules live at the top level of the repository
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+@pytest.fixture
+def make_repos(tmp_path):
+    """Create git repository folders (and optionally plain ones) under a root"""
+    def make(root_name, names, plain=()):
+        root = tmp_path / root_name
+        for name in names:
+            (root / name / '.git').mkdir(parents=True)
+        for name in plain:
+            (root / name).mkdir(parents=True)
+        return root
+    return make
@@ -0,0 +1,76 @@
+import os
+
+import pytest
+
+from config_manager import ConfigManager
+from repo_manager import RepoManager, remove_tree
+
+def test_remove_tree_tallies_files_and_bytes(tmp_path):
+    repo = tmp_path / 'repo'
+    (repo / '.git' / 'objects').mkdir(parents=True)
+    (repo / 'a.txt').write_text('12345')
+    (repo / '.git' / 'objects' / 'obj').write_text('123')
+    os.chmod(repo / '.git' / 'objects' / 'obj', 0o444)
+    calls = []
+    
+    remove_tree(repo, lambda files, size: calls.append((files, size)))
+    
+    assert not repo.exists()
+    assert sum(files for files, _ in calls) == 2
+    assert sum(size for _, size in calls) == 8
+
+def test_remove_tree_unlinks_symlinks_without_following_them(tmp_path):
+    outside = tmp_path / 'outside'
+    outside.mkdir()
+    (outside / 'keep.txt').write_text('keep')
+    repo = tmp_path / 'repo'
+    repo.mkdir()
+    (repo / 'link').symlink_to(outside)
+    
+    remove_tree(repo)
+    
+    assert not repo.exists()
+    assert (outside / 'keep.txt').exists()
+
+def test_remove_tree_refuses_a_symlinked_root(tmp_path):
+    target = tmp_path / 'target'
+    target.mkdir()
+    (target / 'keep.txt').write_text('keep')
+    link = tmp_path / 'link'
+    link.symlink_to(target)
+    
+    with pytest.raises(OSError):
+        remove_tree(link)
+    assert (target / 'keep.txt').exists()
+
+def test_bulk_delete_collects_failures_and_updates_list(make_repos):
+    root = make_repos('root', ['alpha', 'bravo', 'charlie', 'delta'])
+    manager = RepoManager()
+    manager.set_base_paths([root])
+    manager.wait_for_scan()
+    manager.keep_current_repo()
+    manager.keep_current_repo()
+    paths = manager.get_repo_paths()
+    missing = paths[0].parent / 'missing'
+    
+    bulk = manager.start_bulk_delete([paths[0], paths[2], missing], workers=2)
+    assert bulk.wait(5)
+    decisions = manager.finish_bulk_delete(bulk)
+    
+    assert [path.name for path, _ in bulk.failures] == ['missing']
+    assert sorted(repo.name for repo, _, _ in decisions) == ['alpha', 'charlie']
+    assert [path.name for path in manager.get_repo_paths()] == ['bravo', 'delta']
+    # The cursor was on charlie, which is gone; the next repo slides in
+    assert manager.get_current_repo()['name'] == 'Delta'
+    assert bulk.get_progress()['repos'] == 3
+
+def test_bad_delete_settings_fall_back_to_defaults(tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path))
+    config = ConfigManager()
+    config._save_config({'storage_type': 'nvme', 'delete_workers': '4'})
+    
+    assert config.get_delete_settings() == {'storage_type': 'ssd', 'workers': 8}
+    with pytest.raises(ValueError):
+        config.set_delete_settings('ssd', workers='4')
+    with pytest.raises(ValueError):
+        config.set_delete_settings('nvme')
@@ -0,0 +1,131 @@
+import csv
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+import inventory_exporter
+from inventory_exporter import export_inventory, repo_record
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason='git is not installed')
+
+COMMIT_DATE = '2019-03-04T05:06:07+02:00'
+
+def git(repo, *args, date=COMMIT_DATE):
+    env = dict(
+        os.environ,
+        GIT_AUTHOR_NAME='Tester', GIT_AUTHOR_EMAIL='t@example.com',
+        GIT_COMMITTER_NAME='Tester', GIT_COMMITTER_EMAIL='t@example.com',
+        GIT_AUTHOR_DATE=date, GIT_COMMITTER_DATE=date,
+    )
+    result = subprocess.run(
+        ['git', '-C', str(repo), *args], env=env, check=True, capture_output=True, text=True
+    )
+    return result.stdout.strip()
+
+@pytest.fixture
+def repo(tmp_path):
+    path = tmp_path / 'root' / 'project'
+    path.mkdir(parents=True)
+    git(path, 'init', '-q')
+    git(path, 'remote', 'add', 'origin', 'https://example.com/project.git')
+    (path / 'README.md').write_text('hello\n')
+    git(path, 'add', 'README.md')
+    git(path, 'commit', '-q', '-m', 'first')
+    return path
+
+def test_record_reads_commit_remote_and_size(repo):
+    record = repo_record(repo, repo.parent, 'keep')
+    
+    assert record['last_commit'] == git(repo, 'rev-parse', 'HEAD')
+    assert record['last_commit_time'] == COMMIT_DATE
+    assert record['remote'] == 'https://example.com/project.git'
+    assert record['size_bytes'] > 0
+    assert record['decision'] == 'keep'
+
+def test_commit_time_ignores_later_checkouts(repo):
+    # Moving HEAD today must not make an old commit look recent
+    git(repo, 'checkout', '-q', '-b', 'other')
+    
+    assert repo_record(repo, repo.parent, 'pending')['last_commit_time'] == COMMIT_DATE
+
+def test_packed_refs_and_delta_objects(repo):
+    for i in range(20):
+        (repo / 'README.md').write_text('hello\n' * 200 + f'{i}\n')
+        git(repo, 'commit', '-q', '-am', f'change {i}', date=f'2020-01-{i + 1:02d}T00:00:00+00:00')
+    git(repo, 'gc', '-q', '--aggressive')
+    assert not list((repo / '.git' / 'objects').glob('??/*'))
+    
+    record = repo_record(repo, repo.parent, 'pending')
+    
+    assert record['last_commit'] == git(repo, 'rev-parse', 'HEAD')
+    assert record['last_commit_time'] == '2020-01-20T00:00:00+00:00'
+    
+    # The README versions are stored as deltas; each must rebuild exactly
+    pack = next((repo / '.git' / 'objects' / 'pack').glob('*.idx'))
+    verify = git(repo, 'verify-pack', '-v', str(pack)).splitlines()
+    deltas = [line.split()[0] for line in verify if line.split()[1:2] == ['blob'] and len(line.split()) > 5]
+    assert deltas
+    for sha in deltas:
+        obj_type, data = inventory_exporter._read_object([str(repo / '.git' / 'objects')], sha)
+        assert obj_type == 'blob'
+        assert data.decode() == git(repo, 'cat-file', '-p', sha) + '\n'
+
+def test_linked_worktree_reads_through_commondir(repo, tmp_path):
+    worktree = tmp_path / 'root' / 'project-wt'
+    git(repo, 'worktree', 'add', '-q', '-b', 'wt', str(worktree))
+    
+    record = repo_record(worktree, worktree.parent, 'pending')
+    
+    assert record['last_commit'] == git(repo, 'rev-parse', 'HEAD')
+    assert record['last_commit_time'] == COMMIT_DATE
+    assert record['remote'] == 'https://example.com/project.git'
+
+def test_shared_clone_reads_objects_through_alternates(repo, tmp_path):
+    clone = tmp_path / 'root' / 'shared'
+    git(tmp_path, 'clone', '-q', '--shared', str(repo), str(clone))
+    assert not list((clone / '.git' / 'objects').glob('??/*'))
+    
+    record = repo_record(clone, clone.parent, 'pending')
+    
+    assert record['last_commit'] == git(repo, 'rev-parse', 'HEAD')
+    assert record['last_commit_time'] == COMMIT_DATE
+
+def test_non_utf8_config_is_tolerated(repo):
+    with open(repo / '.git' / 'config', 'ab') as f:
+        f.write(b'[user]\n\tname = Jos\xe9\n')
+    
+    record = repo_record(repo, repo.parent, 'pending')
+    
+    assert record['remote'] == 'https://example.com/project.git'
+
+def test_broken_repo_gets_null_metadata_and_export_continues(repo, tmp_path, monkeypatch):
+    broken = repo.parent / 'broken'
+    (broken / '.git').mkdir(parents=True)
+    
+    def fail(path):
+        if path == str(broken):
+            raise RuntimeError('unreadable')
+        return 0
+    monkeypatch.setattr(inventory_exporter, '_dir_size', fail)
+    
+    output = tmp_path / 'inventory.jsonl'
+    count, failures = export_inventory(
+        [(broken, repo.parent, 'pending'), (repo, repo.parent, 'keep')], output)
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    
+    assert count == 2
+    assert [(path, str(error)) for path, error in failures] == [(broken, 'unreadable')]
+    assert records[0]['name'] == 'broken' and records[0]['size_bytes'] is None
+    assert records[1]['last_commit_time'] == COMMIT_DATE
+
+def test_csv_export_has_one_row_per_repo(repo, tmp_path):
+    output = tmp_path / 'inventory.csv'
+    export_inventory([(repo, repo.parent, 'delete')], output)
+    
+    with open(output, newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert [row['name'] for row in rows] == ['project']
+    assert rows[0]['decision'] == 'delete'
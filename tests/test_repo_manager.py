@@ -0,0 +1,115 @@
+from pathlib import Path
+
+from config_manager import ConfigManager
+from repo_manager import RepoManager
+
+def names(manager):
+    return [path.name for path in manager.get_repo_paths()]
+
+def test_roots_merge_into_one_alphabetical_list(make_repos):
+    first = make_repos('first', ['delta', 'alpha'], plain=['not-a-repo'])
+    second = make_repos('second', ['charlie', 'bravo'])
+    
+    manager = RepoManager()
+    manager.set_base_paths([first, second])
+    manager.wait_for_scan()
+    
+    assert names(manager) == ['alpha', 'bravo', 'charlie', 'delta']
+    assert not manager.is_scanning()
+
+def test_duplicate_roots_are_scanned_once(make_repos):
+    root = make_repos('root', ['a', 'b', 'c'])
+    
+    manager = RepoManager()
+    manager.set_base_paths([str(root), str(root) + '/'])
+    manager.wait_for_scan()
+    
+    assert len(manager.base_paths) == 1
+    assert names(manager) == ['a', 'b', 'c']
+
+def test_late_root_merges_after_the_repo_on_screen(make_repos):
+    first = make_repos('first', ['delta', 'echo'])
+    late = make_repos('late', ['alpha', 'foxtrot'])
+    
+    manager = RepoManager()
+    manager.set_base_paths([first])
+    manager.wait_for_scan()
+    assert manager.get_current_repo()['name'] == 'Delta'
+    
+    manager._merge_repos(late, [late / 'alpha', late / 'foxtrot'])
+    
+    # The repo being reviewed stays put; the rest stays sorted
+    assert manager.get_current_repo()['name'] == 'Delta'
+    assert names(manager) == ['delta', 'alpha', 'echo', 'foxtrot']
+
+def test_merge_before_anything_shown_keeps_full_order(make_repos):
+    first = make_repos('first', ['delta'])
+    late = make_repos('late', ['alpha'])
+    
+    manager = RepoManager()
+    manager.set_base_paths([first])
+    manager.wait_for_scan()
+    manager._merge_repos(late, [late / 'alpha'])
+    
+    assert names(manager) == ['alpha', 'delta']
+
+def test_merge_skips_repos_already_listed(make_repos):
+    root = make_repos('root', ['alpha', 'bravo'])
+    
+    manager = RepoManager()
+    manager.set_base_paths([root])
+    manager.wait_for_scan()
+    manager._merge_repos(root, [Path(root) / 'alpha'])
+    
+    assert names(manager) == ['alpha', 'bravo']
+
+def test_missing_root_is_reported(make_repos, tmp_path):
+    root = make_repos('root', ['alpha'])
+    missing = tmp_path / 'unmounted'
+    
+    manager = RepoManager()
+    manager.set_base_paths([root, missing])
+    manager.wait_for_scan()
+    
+    assert names(manager) == ['alpha']
+    assert [path for path, _ in manager.scan_errors] == [missing]
+
+def test_root_can_be_added_while_another_is_offline(make_repos, tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+    external = make_repos('external', ['alpha'])
+    local = make_repos('local', ['bravo'])
+    config = ConfigManager()
+    config.set_base_paths([external])
+    external.rename(tmp_path / 'unplugged')
+    
+    config.add_base_path(local)
+    
+    assert config.get_base_paths() == [str(external), str(local)]
+
+def test_load_repos_seeds_a_session_without_scanning(tmp_path):
+    first, second = tmp_path / 'first', tmp_path / 'second'
+    
+    manager = RepoManager()
+    manager.load_repos([(first / 'delta', first), (second / 'bravo', second),
+                        (first / 'alpha', first)])
+    
+    assert names(manager) == ['alpha', 'bravo', 'delta']
+    assert manager.base_paths == [first, second]
+    assert not manager.is_scanning()
+
+def test_saved_decisions_appear_in_inventory(make_repos, tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+    root = make_repos('root', ['alpha', 'bravo'])
+    config = ConfigManager()
+    config.record_decisions([
+        (root / 'alpha', root, 'keep'),
+        (root / 'gone', root, 'delete'),
+    ])
+    
+    manager = RepoManager()
+    manager.set_decisions(config.load_decisions())
+    manager.set_base_paths([root])
+    manager.wait_for_scan()
+    entries = {repo.name: decision for repo, _, decision in manager.inventory_entries()}
+    
+    assert entries == {'alpha': 'keep', 'bravo': 'pending', 'gone': 'delete'}
@@ -0,0 +1,102 @@
+import os
+import threading
+import time
+
+import pytest
+
+from config_manager import ConfigManager
+from repo_manager import scan_root_network
+
+class HangingFS:
+    """Filesystem shim whose '.git' probes hang for chosen entries"""
+    def __init__(self, hang=(), hang_listing=False):
+        self.hang = set(hang)
+        self.hang_listing = hang_listing
+        self.release = threading.Event()
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+    
+    def scandir(self, path):
+        if self.hang_listing:
+            self.release.wait()
+        return os.scandir(path)
+    
+    def exists(self, path):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            if os.path.basename(os.path.dirname(path)) in self.hang:
+                self.release.wait()
+            else:
+                time.sleep(0.001)
+            return os.path.exists(path)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+@pytest.fixture
+def fs():
+    shim = HangingFS()
+    yield shim
+    shim.release.set()
+
+def test_network_scan_finds_repos_and_skips_files(make_repos, fs):
+    root = make_repos('root', ['b', 'a'], plain=['plain'])
+    (root / 'file.txt').write_text('')
+    
+    repos, timed_out = scan_root_network(root, 4, 1.0, scandir=fs.scandir, exists=fs.exists)
+    
+    assert [p.name for p in repos] == ['a', 'b']
+    assert timed_out == []
+    assert fs.peak <= 4
+
+def test_hung_probe_is_reported_and_stays_within_limit(make_repos, fs):
+    names = [f'repo-{i:02d}' for i in range(20)]
+    root = make_repos('root', names)
+    fs.hang = {'repo-03'}
+    
+    repos, timed_out = scan_root_network(root, 4, 0.2, scandir=fs.scandir, exists=fs.exists)
+    
+    assert [p.name for p in timed_out] == ['repo-03']
+    assert len(repos) == 19
+    # The abandoned probe still counts towards the in-flight limit
+    assert fs.peak <= 4
+
+def test_root_fails_once_every_probe_is_stuck(make_repos, fs):
+    root = make_repos('root', [f'repo-{i:03d}' for i in range(200)])
+    fs.hang = {f'repo-{i:03d}' for i in range(200)}
+    
+    with pytest.raises(TimeoutError):
+        scan_root_network(root, 4, 0.1, scandir=fs.scandir, exists=fs.exists)
+    assert fs.active <= 4
+
+def test_root_listing_times_out(make_repos, fs):
+    root = make_repos('root', ['a'])
+    fs.hang_listing = True
+    
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        scan_root_network(root, 4, 0.1, scandir=fs.scandir, exists=fs.exists)
+    assert time.monotonic() - start < 2
+
+def test_missing_root_is_empty(tmp_path):
+    assert scan_root_network(tmp_path / 'missing', 4, 1.0) == ([], [])
+
+def test_invalid_limits_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        scan_root_network(tmp_path, 0, 1.0)
+    with pytest.raises(ValueError):
+        scan_root_network(tmp_path, 4, -1)
+
+def test_bad_scan_settings_fall_back_to_defaults(tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path))
+    config = ConfigManager()
+    config._save_config({'scan_mode': 'network', 'scan_concurrency': 0, 'scan_timeout': -2})
+    
+    assert config.get_scan_settings() == {'mode': 'network', 'concurrency': 16, 'timeout': 5.0}
+    with pytest.raises(ValueError):
+        config.set_scan_settings('network', concurrency=0)
+    with pytest.raises(ValueError):
+        config.set_scan_settings('network', timeout=-1)
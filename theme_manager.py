@@ -0,0 +1,145 @@
+from PyQt6.QtGui import QColor, QGuiApplication, QPalette
+from qt_material import add_fonts, get_theme
+
+THEMES = ['light_blue', 'dark_blue']
+
+# Additional stylesheets for better text contrast and consistent styling
+THEME_OVERRIDES = {
+    'light_blue': """
+        QLabel { color: #000000; }
+        QPushButton {
+            color: #000000;
+            border-radius: 5px;
+            padding: 5px;
+        }
+        QPushButton:hover {
+            background-color: rgba(0, 0, 0, 0.1);
+        }
+        QMainWindow { background-color: #ffffff; }
+        QFrame {
+            border-radius: 8px;
+            background-color: rgba(255, 255, 255, 0.8);
+            border: 1px solid #dddddd;
+        }
+    """,
+    'dark_blue': """
+        QLabel { color: #ffffff; }
+        QPushButton {
+            color: #ffffff;
+            border-radius: 5px;
+            padding: 5px;
+        }
+        QPushButton:hover {
+            background-color: rgba(255, 255, 255, 0.1);
+        }
+        QMainWindow { background-color: #2d2d2d; }
+        QFrame {
+            border-radius: 8px;
+            background-color: rgba(45, 45, 45, 0.8);
+            border: 1px solid #444444;
+        }
+    """,
+}
+
+# Per-widget styling, selected by the 'role' property or object name so it
+# is parsed once with the app stylesheet rather than once per widget
+WIDGET_STYLESHEET = """
+    QFrame[role="panel"], QFrame[role="panel"] QFrame {
+        border-radius: 10px;
+    }
+    QPushButton[role="primary"] {
+        background-color: #3498db;
+        color: white;
+        border-radius: 8px;
+        padding: 10px;
+    }
+    QPushButton[role="primary"]:hover {
+        background-color: #2980b9;
+    }
+    QPushButton[role="primary"]:pressed, QPushButton[role="primary"]:checked {
+        background-color: #21618c;
+    }
+    QPushButton[role="danger"] {
+        background-color: #e74c3c;
+        color: white;
+        border-radius: 8px;
+        padding: 10px;
+    }
+    QPushButton[role="danger"]:hover {
+        background-color: #c0392b;
+    }
+    QPushButton[role="danger"]:pressed {
+        background-color: #922b21;
+    }
+    QPushButton[role="success"] {
+        background-color: #2ecc71;
+        color: white;
+        border-radius: 8px;
+        padding: 10px;
+    }
+    QPushButton[role="success"]:hover {
+        background-color: #27ae60;
+    }
+    QPushButton[role="success"]:pressed {
+        background-color: #1e8449;
+    }
+    QLabel#pathLabel {
+        color: #000000;
+        background-color: #ffffff;
+        padding: 8px;
+        border-radius: 5px;
+        border: 1px solid #cccccc;
+    }
+    QLabel#repoNameLabel {
+        color: #2c3e50;
+        margin: 10px;
+    }
+    QLabel#repoPathLabel {
+        color: #7f8c8d;
+        margin: 5px;
+    }
+"""
+
+class ThemeManager:
+    """Applies the light and dark themes without regenerating anything per switch.
+    
+    qt-material's apply_stylesheet renders its whole QSS template and icon
+    set on every call, and that QSS was then replaced by our overrides
+    anyway. Here the Fusion style and fonts are set up once, each theme's
+    stylesheet and palette colour are worked out once, and a switch is one
+    palette update plus one setStyleSheet() with a prebuilt string.
+    """
+    def __init__(self):
+        self._stylesheets = {}
+        self._text_colors = {}
+        self._initialised = False
+    
+    def get_stylesheet(self, theme):
+        """Get the prebuilt application stylesheet for a theme"""
+        if theme not in self._stylesheets:
+            self._stylesheets[theme] = THEME_OVERRIDES[theme] + WIDGET_STYLESHEET
+        return self._stylesheets[theme]
+    
+    def _text_color(self, theme):
+        """The palette text colour qt-material derives from the theme's primary colour"""
+        if theme not in self._text_colors:
+            primary = get_theme(f'{theme}.xml')['primaryColor']
+            self._text_colors[theme] = QColor(
+                *[int(primary[i:i + 2], 16) for i in range(1, 6, 2)], 92
+            )
+        return self._text_colors[theme]
+    
+    def apply(self, app, theme):
+        """Apply a theme to the whole application"""
+        if not self._initialised:
+            app.setStyle('Fusion')
+            try:
+                add_fonts()
+            except Exception as e:
+                print(f"Could not load theme fonts: {e}")
+            self._initialised = True
+        
+        palette = QGuiApplication.palette()
+        palette.setColor(QPalette.ColorRole.Text, self._text_color(theme))
+        QGuiApplication.setPalette(palette)
+        app.setStyleSheet(self.get_stylesheet(theme))